@@ -9,28 +9,34 @@ server / frontends, should be implemented in handlers that are attached to each
 """
 import asyncio
 import logging
-from typing import List, Optional
+from types import MappingProxyType
+from typing import Any, Generator, List, Optional
 
 from kernel_sidecar.handlers.base import Handler
 from kernel_sidecar.models import messages, requests
 
 logger = logging.getLogger(__name__)
 
-REPLY_MSG_TYPES = {
-    "kernel_info_request": "kernel_info_reply",
-    "execute_request": "execute_reply",
-    "inspect_request": "inspect_reply",
-    "complete_request": "complete_reply",
-    "history_request": "history_reply",
-    "is_complete_request": "is_complete_reply",
-    "comm_info_request": "comm_info_reply",
-    "shutdown_request": "shutdown_reply",
-    "interrupt_request": "interrupt_reply",
-    "debug_request": "debug_reply",
-    "comm_open": None,
-    "comm_msg": None,
-    "comm_close": None,
-}
+# Read-only, custom Actions should extend it in a subclass, see the ValueError in KernelAction
+REPLY_MSG_TYPES = MappingProxyType(
+    {
+        "kernel_info_request": "kernel_info_reply",
+        "execute_request": "execute_reply",
+        "inspect_request": "inspect_reply",
+        "complete_request": "complete_reply",
+        "history_request": "history_reply",
+        "is_complete_request": "is_complete_reply",
+        "comm_info_request": "comm_info_reply",
+        "shutdown_request": "shutdown_reply",
+        "interrupt_request": "interrupt_reply",
+        "debug_request": "debug_reply",
+        "comm_open": None,
+        "comm_msg": None,
+        "comm_close": None,
+    }
+)
+
+_MISSING = object()  # sentinel for REPLY_MSG_TYPES lookups, None is a valid expected reply type
 
 
 class KernelAction:
@@ -38,20 +44,27 @@ class KernelAction:
 
     def __init__(self, request: requests.Request, handlers: Optional[List[Handler]] = None):
         self.request = request
-        if request.header.msg_type not in self.REPLY_MSG_TYPES:
+        # Plain attributes rather than properties walking request.header, these are read for every
+        # message routed to this Action
+        self.msg_id: str = request.header.msg_id
+        self.msg_type: str = request.header.msg_type
+        expected_reply_msg_type = self.REPLY_MSG_TYPES.get(self.msg_type, _MISSING)
+        if expected_reply_msg_type is _MISSING:
             raise ValueError(
-                f"Unrecognized request type {request.header.msg_type}. Raising error because "
+                f"Unrecognized request type {self.msg_type}. Raising error because "
                 "the KernelAction would not know when the request-reply cycle is finished. If you "
-                "have a custom request type, add it to KernelAction.REPLY_MSG_TYPES."
+                "have a custom request type, subclass KernelAction and extend REPLY_MSG_TYPES."
             )
-        self.expected_reply_msg_type = self.REPLY_MSG_TYPES[request.header.msg_type]
+        self.expected_reply_msg_type = expected_reply_msg_type
+        self._reply_required = expected_reply_msg_type is not None
 
         # Events tied to making this instance awaitable
         self.running = False
         self.kernel_idle = asyncio.Event()  # gets set when kernel status reports idle
         self.reply_seen = asyncio.Event()  # gets set when we see execute_reply or the like
         self.done = asyncio.Event()
-        self.safety_net_task = None  # see .kernel_idle_safety_net docstring
+        self.safety_net_handle: Optional[asyncio.TimerHandle] = None  # see .kernel_idle_safety_net
+        self.safety_net_task: Optional[asyncio.Task] = None
 
         # Routing messages to handlers
         self.handlers = handlers or []
@@ -61,20 +74,15 @@ class KernelAction:
         # instances that might have same request msg_id
         self.sent = False
 
-    @property
-    def msg_id(self):
-        return self.request.header.msg_id
-
-    @property
-    def msg_type(self):
-        return self.request.header.msg_type
-
     def __repr__(self):
         return f"<{self.__class__.__name__} {self.msg_type} {self.msg_id}>"
 
-    def __await__(self) -> asyncio.Event:
+    def __await__(self) -> Generator[Any, None, bool]:
         """Support 'await action' syntax"""
-        return self.done.wait().__await__()
+        if self.done.is_set():
+            # Already complete, don't bother creating a done.wait() coroutine
+            return True
+        return (yield from self.done.wait().__await__())
 
     async def maybe_set_done(self):
         """
@@ -84,28 +92,36 @@ class KernelAction:
            execute_request isn't "complete" until we get execute_reply
         """
         if self.kernel_idle.is_set():
-            if self.reply_seen.is_set() or not self.expected_reply_msg_type:
-                for handler in self.handlers:
-                    await handler.action_complete()
+            if not self._reply_required or self.reply_seen.is_set():
+                # Order between handlers' finalizers doesn't matter, run them concurrently
+                await asyncio.gather(*(handler.action_complete() for handler in self.handlers))
 
                 self.running = False
                 self.done.set()
-                if self.safety_net_task:
-                    self.safety_net_task.cancel()
+                if self.safety_net_handle:
+                    self.safety_net_handle.cancel()
+                    self.safety_net_handle = None
 
-    async def kernel_idle_safety_net(self):
+    def kernel_idle_safety_net(self):
         """
         Sometimes we just don't see the expected reply, who knows why. It seems most common with
         execute_reply, especially during tests running in CI but I've seen it happen in prod too.
+
+        This is scheduled with loop.call_later when the Kernel goes idle, rather than creating a
+        Task that sleeps for every Action, and only spins up a Task in the rare case it fires.
         """
-        await asyncio.sleep(3)  # Todo: decide if this needs to be a setting
-        if self.running and self.expected_reply_msg_type:
+        self.safety_net_handle = None
+        if self.running and self._reply_required:
             logger.warning(
                 f"Action {self} still running 3 seconds after Kernel went idle. Expected to see "
                 f"{self.expected_reply_msg_type} by now but have not. Setting done anyway."
             )
             self.reply_seen.set()
-            await self.maybe_set_done()
+            self.safety_net_task = asyncio.create_task(self.maybe_set_done())
+
+    async def _delegate_serially(self, handlers: List[Handler], msg: messages.Message):
+        for handler in handlers:
+            await handler(msg)
 
     async def handle_message(self, msg: messages.Message):
         """
@@ -114,10 +130,29 @@ class KernelAction:
         an expected message reply type (or kicked off a "safety net" task since sometimes we do
         not see the expected reply, especially for execute_request / execute_reply)
         """
-        # Delegate the message to any attached handlers, in the order they were attached
-        # TODO: consider pros and cons of asyncio.gather handlers instead of awaiting serially
+        # Delegate the message to any attached handlers, in the order they were attached. Handlers
+        # flagged as independent run concurrently alongside that serial chain.
+        serial_handlers = []
+        independent_coros = []
+        method_name = f"handle_{msg.msg_type}"
         for handler in self.handlers:
-            await handler(msg)
+            if isinstance(handler, Handler):
+                independent = handler.independent
+                if not handler._catch_all:
+                    # Handler.__call__ isn't overridden, so call the handle_<msg_type> method it
+                    # would look up directly rather than looking it up a second time in __call__
+                    handler = getattr(handler, method_name, None)
+                    if handler is None:
+                        continue  # nothing would run besides the default no-op unhandled_message
+                if independent:
+                    independent_coros.append(handler(msg))
+                    continue
+            serial_handlers.append(handler)
+        if independent_coros:
+            await asyncio.gather(self._delegate_serially(serial_handlers, msg), *independent_coros)
+        else:
+            for handler in serial_handlers:
+                await handler(msg)
 
         # Checking for status / special reply type in order to maybe set "done"
         if msg.msg_type == "status":
@@ -128,9 +163,10 @@ class KernelAction:
                 await self.maybe_set_done()
                 # Normally shouldn't see kernel go idle before we see the expected reply type
                 # but hence the name, this is a safety net
-                if self.running:
-                    logger.debug(f"Creating safety net task for {self}")
-                    self.safety_net_task = asyncio.create_task(self.kernel_idle_safety_net())
+                if self.running and not self.safety_net_handle:
+                    logger.debug("Scheduling safety net for %s", self)
+                    loop = asyncio.get_running_loop()
+                    self.safety_net_handle = loop.call_later(3, self.kernel_idle_safety_net)
 
         elif msg.msg_type == self.expected_reply_msg_type:
             self.reply_seen.set()
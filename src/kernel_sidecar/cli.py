@@ -3,23 +3,38 @@ import json
 import logging
 import pathlib
 import pprint
+import signal
 from typing import Optional
 
 import typer
 from jupyter_client import KernelConnectionInfo
 
-from kernel_sidecar.client import KernelSidecarClient
+from kernel_sidecar.client import KernelSidecarClient, install_uvloop
 from kernel_sidecar.handlers.base import Handler
-from kernel_sidecar.handlers.debug import DebugHandler
 from kernel_sidecar.log_utils import setup_logging
 from kernel_sidecar.models import messages
 from kernel_sidecar.settings import get_settings
 
+# orjson is an optional dependency, it's much faster than pprint at formatting large payloads like
+# kernel_info or rich execute_result data for logging. Fall back to pprint if it isn't installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 app = typer.Typer(no_args_is_help=True)
 
 
+def _fmt(obj) -> str:
+    """Pretty-format a dict for logging"""
+    if orjson is None:
+        return pprint.pformat(obj)
+    option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+    return orjson.dumps(obj, option=option, default=str).decode()
+
+
 class OutputHandler(Handler):
     async def handle_stream(self, msg: messages.Stream):
         if msg.content.name == "stdout":
@@ -28,12 +43,25 @@ class OutputHandler(Handler):
             logger.error(msg.content.text)
 
     async def handle_execute_result(self, msg: messages.ExecuteResult):
-        logger.info(pprint.pformat(msg.content.data))
+        logger.info(_fmt(msg.content.data))
 
     async def handle_error(self, msg: messages.Error):
         logger.error(msg.content.evalue)
 
 
+async def wait_for_interrupt():
+    """Block until Ctrl-C without waking up the event loop while idle"""
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    try:
+        loop.add_signal_handler(signal.SIGINT, stop.set)
+    except NotImplementedError:
+        # Windows event loops don't support add_signal_handler, KeyboardInterrupt will still
+        # cancel the wait below
+        pass
+    await stop.wait()
+
+
 async def execute_code(connection_info: KernelConnectionInfo, code: str):
     async with KernelSidecarClient(connection_info) as kernel:
         await kernel.execute_request(code=code, handlers=[OutputHandler()])
@@ -41,13 +69,13 @@ async def execute_code(connection_info: KernelConnectionInfo, code: str):
 
 async def connect(connection_info: KernelConnectionInfo, tail: bool):
     async with KernelSidecarClient(connection_info) as kernel:
-        handler = DebugHandler()
-        await kernel.kernel_info_request(handlers=[handler])
-        kernel_info: messages.KernelInfoReply = handler.get_last_msg("kernel_info_reply")
-        logger.info(pprint.pformat(kernel_info.content.model_dump()))
+        kernel_info = await kernel.get_kernel_info()
+        if kernel_info is None:
+            logger.error("Kernel did not send a kernel_info_reply")
+        else:
+            logger.info(_fmt(kernel_info.content.model_dump()))
         if tail:
-            while True:
-                await asyncio.sleep(0.01)
+            await wait_for_interrupt()
 
 
 @app.command()
@@ -69,7 +97,8 @@ def main(
     else:
         setup_logging()
     connection_info = json.loads(connection_file.read_text())
-    logger.info(f"Attempting to connect:\n{pprint.pformat(connection_info)}")
+    logger.info(f"Attempting to connect:\n{_fmt(connection_info)}")
+    install_uvloop()
     if execute:
         asyncio.run(execute_code(connection_info, execute))
     else:
@@ -18,12 +18,15 @@ assert handler.counts == {"status": 2, "kernel_info_reply": 1}
 import asyncio
 import logging
 import pprint
-from typing import Awaitable, Callable, List, Optional, Type
+import typing
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Type
 
 import pydantic
 import zmq
 from jupyter_client import AsyncKernelClient, KernelConnectionInfo
+from jupyter_client import session as jupyter_session
 from jupyter_client.channels import ZMQSocketChannel
+from jupyter_client.jsonutil import json_default
 from zmq.asyncio import Context
 from zmq.utils.monitor import recv_monitor_message
 
@@ -33,9 +36,82 @@ from kernel_sidecar.handlers.base import Handler
 from kernel_sidecar.models import messages, requests
 from kernel_sidecar.settings import get_settings
 
+# orjson is an optional dependency, used to (de)serialize ZMQ messages if it's installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def install_uvloop(required: bool = False):
+    """
+    Use uvloop for the asyncio event loop if it's installed. It's an optional dependency (and not
+    available on Windows), fall back to the default asyncio event loop otherwise. Call this before
+    asyncio.run() or before your app creates its event loop.
+
+    Pass required=True in deployments that expect uvloop to raise instead of silently falling back.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        if required:
+            raise
+        return
+    if not isinstance(asyncio.get_event_loop_policy(), uvloop.EventLoopPolicy):
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+def _orjson_pack(obj) -> bytes:
+    try:
+        return orjson.dumps(
+            obj, default=json_default, option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+        )
+    except TypeError:
+        # e.g. non-str dict keys or types json_default can't handle, let the stdlib json packer
+        # clean those up
+        return jupyter_session.json_packer(obj)
+
+
+def _orjson_unpack(s: bytes):
+    try:
+        return orjson.loads(s)
+    except orjson.JSONDecodeError:
+        # e.g. NaN or invalid utf-8, which the stdlib json unpacker tolerates
+        return jupyter_session.json_unpacker(s)
+
+
+def _use_orjson(session: jupyter_session.Session):
+    """
+    Serialize outgoing and deserialize incoming ZMQ messages with orjson when it's installed.
+    jupyter_client 8+ already does that on its own, this is only needed on older versions that
+    always use stdlib json.
+    """
+    if orjson is None or hasattr(jupyter_session, "orjson_unpacker"):
+        return
+    session.pack = _orjson_pack
+    session.unpack = _orjson_unpack
+
+
+def _concrete_message_models(message_model) -> Dict[str, Type[pydantic.BaseModel]]:
+    """
+    Map msg_type -> concrete model for an Annotated[Union[models...], Field(discriminator=...)]
+    message model, so that parsing can skip the discriminated union dispatch for known msg_types.
+    Returns an empty dict for anything else, in which case parsing always goes through the union.
+    """
+    models = {}
+    args = typing.get_args(message_model)
+    union = args[0] if args else None
+    for model in typing.get_args(union):
+        field = getattr(model, "model_fields", {}).get("msg_type")
+        if field is None or typing.get_origin(field.annotation) is not typing.Literal:
+            continue
+        for msg_type in typing.get_args(field.annotation):
+            models[msg_type] = model
+    return models
+
+
 class CommTargetNotFound(Exception):
     pass
 
@@ -59,6 +135,19 @@ class CommOpenHandler(Handler):
         self.comm_closed_id = msg.content.comm_id
 
 
+class KernelInfoHandler(Handler):
+    """
+    Attached to kernel_info_request Actions sent by the KernelSidecarClient so that the reply can be
+    cached on the client, see KernelSidecarClient.get_kernel_info
+    """
+
+    def __init__(self, client: "KernelSidecarClient"):
+        self.client = client
+
+    async def handle_kernel_info_reply(self, msg: messages.KernelInfoReply):
+        self.client._kernel_info = msg
+
+
 class KernelSidecarClient:
     """
     Primary interface between our Sidecar and a Kernel.
@@ -77,6 +166,12 @@ class KernelSidecarClient:
     # custom message models defined somewhere besides kernel_sidecar.models.messages
     # should be type: Annotated[Union[models...], Field(discriminator='msg_type')]
     _handler_timeout: Optional[float] = None  # optional timeout when awaiting Action handlers
+    # Finished Actions are kept in .actions so late messages still route to them, but only the most
+    # recent ones. None to keep every Action for the life of the client, 0 to evict finished Actions
+    # as soon as another request is sent. Actions that haven't finished are never evicted.
+    _max_tracked_actions: Optional[int] = 1024
+    _zmq_drain_max: int = 100  # max ready messages read off a socket per wakeup
+    _mq_drain_yield_every: int = 32  # yield to the event loop after this many queued messages
     jupyter_widget_handler: Type[CommHandler] = WidgetHandler
 
     def __init__(
@@ -94,18 +189,30 @@ class KernelSidecarClient:
           outputs or other messages coming in from the Kernel
         - default_handlers: appended to every Action's handler list when Action request is sent
         """
-        zmq_context = Context()  # only relevant if max_message_size is set
+        # A dedicated zmq Context is only needed to apply max_message_size, otherwise share the
+        # process-wide instance rather than spinning up new IO threads for every client
         if max_message_size:
+            zmq_context = Context()
             zmq_context.setsockopt(zmq.SocketOption.MAXMSGSIZE, max_message_size)
+        else:
+            zmq_context = Context.instance()
         self.kc = AsyncKernelClient(context=zmq_context)
         self.kc.load_connection_info(connection_info)
+        _use_orjson(self.kc.session)
         self.kc.start_channels()
 
+        # used to parse incoming messages into the appropriate Pydantic model, see .parse_message
+        self._message_adapter = pydantic.TypeAdapter(self._message_model)
+        self._message_models = _concrete_message_models(self._message_model)
+
         # Used to delegate received messages to handlers attached to the Action
         # When we send a request to the kernel, we use the request msg_id {msg_id: Action}
         # When we receive messages from kernel, we look up the Action by the parent_header.msg_id
         # and delegate the messages to handlers attached to that Action
         self.actions: dict[str, actions.KernelAction] = {}
+        # Subset of .actions that haven't finished yet, in the order they were sent. Used to look
+        # up .running_action without scanning every Action this client has ever sent.
+        self._pending_actions: dict[str, actions.KernelAction] = {}
 
         # message queue, raw data (dict) from all zmq channels gets dropped into here
         # and a separate asyncio.Task picks them up off the queue to pass into the
@@ -118,8 +225,9 @@ class KernelSidecarClient:
         # One parent task with two child tasks per ZMQ channel:
         # - watch for zmq disconnect
         # - pick up zmq messages off socket and drop onto PriorityQueue
-        self.channel_watching_tasks: List[asyncio.Task] = []
-        self.channel_watcher_parent_tasks: List[asyncio.Task] = []
+        # Tasks remove themselves from these sets when they finish, see ._create_tracked_task
+        self.channel_watching_tasks: Set[asyncio.Task] = set()
+        self.channel_watcher_parent_tasks: Set[asyncio.Task] = set()
 
         # Handlers to attach to every Action. These will be appended to action.handlers
         # during .send, which means they'll run /after/ other handlers.
@@ -142,19 +250,48 @@ class KernelSidecarClient:
             "control": False,
         }
 
+        # {channel_name: ZMQSocketChannel}, see ._get_channel. Entries are dropped when a channel
+        # is cycled in .watch_channel so the reconnected channel is picked up.
+        self._channels: Dict[str, ZMQSocketChannel] = {}
+
+        # Read once rather than going through Settings for every message logged. Set it directly
+        # on the client to toggle pretty-printed message bodies in logs after it's created
+        self._pprint_logs: bool = get_settings().pprint_logs
+
+        # Kernel info is effectively immutable for the life of a Kernel, so the latest
+        # kernel_info_reply is cached here. See .get_kernel_info()
+        self._kernel_info: Optional[messages.KernelInfoReply] = None
+        # kernel_info_request sent by .get_kernel_info() that's still waiting on its reply, shared
+        # by concurrent callers so they don't each send their own request
+        self._kernel_info_action: Optional[actions.KernelAction] = None
+
     @property
     def running_action(self) -> Optional[actions.KernelAction]:
         """
         Return a best guess at what action the Kernel is handling right now.
 
-        The logic here is that actions is a dict, which is ordered in Python 3.6+, so iterate
-        through them until we find an action that is not done yet. The first non-done action is
-        the one we're looking for.
+        The logic here is that pending actions is a dict, which is ordered in Python 3.6+, so
+        iterate through them until we find an action that is running. Actions that are done (or
+        no longer tracked) are dropped from the front of the pending dict along the way.
         """
-        for action in self.actions.values():
+        pending = self._pending_actions
+        while pending:
+            msg_id, action = next(iter(pending.items()))
+            if (action.done.is_set() and not action.running) or msg_id not in self.actions:
+                del pending[msg_id]
+                continue
+            break
+        for action in pending.values():
             if action.running:
                 return action
 
+    def _get_channel(self, channel_name: str) -> ZMQSocketChannel:
+        channel = self._channels.get(channel_name)
+        if channel is None:
+            channel = getattr(self.kc, f"{channel_name}_channel")
+            self._channels[channel_name] = channel
+        return channel
+
     def send(self, action: actions.KernelAction) -> actions.KernelAction:
         if action.sent:
             raise RuntimeError(f"{action} already sent to Kernel")
@@ -168,36 +305,71 @@ class KernelSidecarClient:
         action.handlers.extend(self.default_handlers)
         action.handlers.append(self.comm_manager)
 
-        # Send the request over the appropriate zmq channel
+        # Send the request over the appropriate zmq channel. Dump the model once, it's reused
+        # for the log extras below
+        body = action.request.model_dump()
         try:
-            channel: ZMQSocketChannel = getattr(self.kc, f"{action.request._channel}_channel")
-            channel.send(action.request.model_dump())
+            channel = self._get_channel(action.request._channel)
+            channel.send(body)
             action.sent = True
             # Update the .actions dictionary so that we route any observed messages coming to us
             # over ZMQ into this action for handling callbacks
             self.actions[action.msg_id] = action
-
-            log_msg = f"Sent {action.request.header.msg_type} to kernel"
-            log_extra = {}
-            if get_settings().pprint_logs:
-                log_extra["body"] = pprint.pformat(action.request.model_dump())
-            logger.debug(log_msg, extra=log_extra)
+            self._pending_actions[action.msg_id] = action
+            if (
+                self._max_tracked_actions is not None
+                and len(self.actions) > self._max_tracked_actions
+            ):
+                self._evict_done_actions()
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"Sent {action.msg_type} to kernel",
+                    extra={"body": pprint.pformat(body)} if self._pprint_logs else None,
+                )
         except Exception as e:
-            log_msg = f"Error sending {action.request.header.msg_type} message over ZMQ"
+            log_msg = f"Error sending {action.msg_type} message over ZMQ"
             log_extra = {}
-            if get_settings().pprint_logs:
-                log_extra["body"] = pprint.pformat(action.request.model_dump())
+            if self._pprint_logs:
+                log_extra["body"] = pprint.pformat(body)
             logger.error(log_msg, extra=log_extra, exc_info=True)
             raise e
         return action
 
+    def _evict_done_actions(self):
+        """Drop the oldest finished Actions until .actions is back under _max_tracked_actions"""
+        excess = len(self.actions) - self._max_tracked_actions
+        evict = []
+        for msg_id, action in self.actions.items():
+            if len(evict) >= excess:
+                break
+            if action.done.is_set() and not action.running:
+                evict.append(msg_id)
+        for msg_id in evict:
+            del self.actions[msg_id]
+
     def kernel_info_request(
         self, handlers: List[Callable[[messages.Message], Awaitable[None]]] = None
     ) -> actions.KernelAction:
         req = requests.KernelInfoRequest()
+        handlers = [*(handlers or []), KernelInfoHandler(self)]
         action = actions.KernelAction(request=req, handlers=handlers)
         return self.send(action)
 
+    async def get_kernel_info(self, refresh: bool = False) -> Optional[messages.KernelInfoReply]:
+        """
+        Return the kernel_info_reply for this Kernel. A kernel_info_request is only sent over ZMQ
+        the first time this is called (or when refresh=True), after that the cached reply is
+        returned without a round-trip to the Kernel. Concurrent callers share a single in-flight
+        request. Returns None if the Action finished without a kernel_info_reply being seen.
+        """
+        if self._kernel_info is None or refresh:
+            action = self._kernel_info_action
+            if action is None or action.done.is_set():
+                action = self._kernel_info_action = self.kernel_info_request()
+            await action
+        return self._kernel_info
+
     def execute_request(
         self, code: str, silent: bool = False, handlers: List[Handler] = None
     ) -> actions.KernelAction:
@@ -225,6 +397,9 @@ class KernelSidecarClient:
     def shutdown_request(
         self, restart: bool = True, handlers: List[Handler] = None
     ) -> actions.KernelAction:
+        # Kernel might not come back up as the same implementation / version after a restart
+        self._kernel_info = None
+        self._kernel_info_action = None
         req = requests.ShutdownRequest(content={"restart": restart})
         action = actions.KernelAction(request=req, handlers=handlers)
         return self.send(action)
@@ -296,11 +471,18 @@ class KernelSidecarClient:
         This is not wrapped as an Action because there are no replies for input_reply (if anything
         the Sidecar is replying to the Kernel's input_request)
         """
-        req = requests.InputReply(content={"value": value})
+        body = requests.InputReply(content={"value": value}).model_dump()
         try:
-            self.kc.stdin_channel.send(req.model_dump())
+            self._get_channel("stdin").send(body)
         except Exception:
-            logger.exception("Error sending input_reply to stdin", extra={"body": req.model_dump()})
+            logger.exception("Error sending input_reply to stdin", extra={"body": body})
+
+    def _create_tracked_task(self, coro: Awaitable, tasks: Set[asyncio.Task]) -> asyncio.Task:
+        """Create a Task that's held in tasks (so it isn't garbage collected) until it finishes"""
+        task = asyncio.create_task(coro)
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+        return task
 
     async def watch_channel(self, channel_name: str):
         """
@@ -310,22 +492,36 @@ class KernelSidecarClient:
         Cycles the ZMQ connection if it's lost.
         """
         logger.debug("Channel watcher started", extra={"channel": channel_name})
-        channel: ZMQSocketChannel = getattr(self.kc, f"{channel_name}_channel")
+        channel = self._get_channel(channel_name)
 
-        message_task = asyncio.create_task(self._watch_channel_for_messages(channel, channel_name))
-        status_task = asyncio.create_task(
+        message_task = self._create_tracked_task(
+            self._watch_channel_for_messages(channel, channel_name), self.channel_watching_tasks
+        )
+        status_task = self._create_tracked_task(
             self._watch_channel_for_status(
                 channel_name,
                 channel.socket.get_monitor_socket(),
-            )
+            ),
+            self.channel_watching_tasks,
         )
-        self.channel_watching_tasks.append(message_task)
-        self.channel_watching_tasks.append(status_task)
 
         done, pending = await asyncio.wait(
             [message_task, status_task],
             return_when=asyncio.FIRST_COMPLETED,
         )
+        if not channel.is_alive():
+            # ZMQ dropping the connection leaves the channel's socket in place, it's only gone
+            # when the channel was closed on purpose (e.g. kc.stop_channels()). Don't reopen it
+            logger.debug(
+                f"{channel_name} was stopped, not reconnecting", extra={"channel": channel_name}
+            )
+            for task in pending:
+                task.cancel()
+            for task in done:
+                if not task.cancelled():
+                    task.exception()  # errors reading off the closed socket are expected here
+            return
+
         logger.debug(
             f"Cycling {channel_name} based on task ending", extra={"channel": channel_name}
         )
@@ -335,8 +531,10 @@ class KernelSidecarClient:
         # is None. If it is None, it starts the connection on that channel. Setting this attr
         # back to None will force a reconnect next time the property is accessed.
         setattr(self.kc, f"_{channel_name}_channel", None)
-        task = asyncio.create_task(self.watch_channel(channel_name))
-        self.channel_watcher_parent_tasks.append(task)
+        self._channels.pop(channel_name, None)
+        self._create_tracked_task(
+            self.watch_channel(channel_name), self.channel_watcher_parent_tasks
+        )
 
         # Finish cleanup
         for task in pending:
@@ -345,9 +543,6 @@ class KernelSidecarClient:
             if task.exception():
                 raise task.exception()
 
-        self.channel_watching_tasks.remove(message_task)
-        self.channel_watching_tasks.remove(status_task)
-
         # Provide a hook for subclasses to take action on channel disconnects
         await self.handle_zmq_disconnect(channel_name)
 
@@ -379,29 +574,49 @@ class KernelSidecarClient:
 
     async def _watch_channel_for_messages(self, channel: ZMQSocketChannel, channel_name: str):
         """Takes messages seen on zmq and drops them into our internal asyncio.Queue"""
+        # Synchronous view of the same socket, used to pick up messages that are already waiting
+        # after an await wakes us up instead of awaiting a Future for each one
+        sync_socket: Optional[zmq.Socket] = None
         while True:
             try:
                 if not channel.is_alive():
-                    await asyncio.sleep(0.001)
-                    continue
+                    # Channel was stopped, end this task instead of polling until it's cancelled.
+                    # watch_channel sees the closed channel and doesn't reopen it
+                    return
                 raw_msg: dict = await channel.get_msg()
-                self.mq.put_nowait(raw_msg)
-                msg_type = raw_msg.get("msg_type", "")
-
-                # When using kernel-sidecar in a production app, we noticed that pprint.pformat
-                # caused OOMs due to pprint.pformat trying to format large messages (e.g.
-                # display_data for large Dataframes formatted with dx.py).
-                log_msg = f"Message {msg_type} on {channel_name}"
-                log_extra = {"channel": channel_name}
-                if get_settings().pprint_logs:
-                    log_extra["body"] = pprint.pformat(raw_msg)
-                logger.debug(log_msg, extra=log_extra)
+                self._enqueue_message(raw_msg, channel_name)
+
+                if sync_socket is None:
+                    sync_socket = zmq.Socket.shadow(channel.socket.underlying)
+                for _ in range(self._zmq_drain_max):
+                    try:
+                        parts = sync_socket.recv_multipart(zmq.NOBLOCK)
+                    except zmq.Again:
+                        break
+                    _, parts = channel.session.feed_identities(parts)
+                    self._enqueue_message(channel.session.deserialize(parts), channel_name)
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.exception("Error retrieving message from zmq")
                 raise e
 
+    def _enqueue_message(self, raw_msg: dict, channel_name: str):
+        self.mq.put_nowait(raw_msg)
+        # This runs for every message, skip building the log message entirely unless it'll be seen
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        msg_type = raw_msg.get("msg_type", "")
+
+        # When using kernel-sidecar in a production app, we noticed that pprint.pformat
+        # caused OOMs due to pprint.pformat trying to format large messages (e.g.
+        # display_data for large Dataframes formatted with dx.py).
+        log_msg = f"Message {msg_type} on {channel_name}"
+        log_extra = {"channel": channel_name}
+        if self._pprint_logs:
+            log_extra["body"] = pprint.pformat(raw_msg)
+        logger.debug(log_msg, extra=log_extra)
+
     async def process_message(self):
         """
         Takes messages from our internal asyncio.Queue, parses them into pydantic models using
@@ -410,51 +625,84 @@ class KernelSidecarClient:
 
         Action handlers are awaited before the next message is processed.
         """
-        # used to parse incoming messages into the appropriate Pydantic model
-        type_adapter = pydantic.TypeAdapter(self._message_model)
         while True:
-            # Pull dictionaries off the internal message queue
+            # Pull dictionaries off the internal message queue. After waking up for one message,
+            # drain everything else that's already queued (e.g. a burst of stream outputs) without
+            # going back through the event loop for each one.
             raw_msg: dict = await self.mq.get()
-
-            # kernel status "starting" is one example of messages with no parent header
-            if not raw_msg.get("parent_header"):
-                await self.handle_missing_parent_msg_id(raw_msg)
-                continue
-
-            # Getting a ValidationError here probably means we need to add new Message models
-            try:
-                msg = type_adapter.validate_python(raw_msg)
-            except pydantic.ValidationError as e:
-                await self.handle_unparseable_message(raw_msg, e)
-
-            # Getting an "untracked action" probably means another client is talking to the Kernel
-            # over ZMQ and sending in requests
-            if msg.parent_header.msg_id not in self.actions:
-                await self.handle_untracked_action(msg)
-                continue
-
-            # Happy path: we have an Action for the parent request of messages we see coming in
-            action = self.actions[msg.parent_header.msg_id]
-
-            # Log warning if we think we're seeing responses for a new Action and haven't completed
-            # the previously running action, e.g. we start getting status / content responses for
-            # a new execute_request when we haven't seen execute_reply / status idle for a previous
-            # execute request
-            if self.running_action and self.running_action is not action:
-                logger.warning(
-                    f"Observed message for {action} while {self.running_action} has not finished"
-                )
-
-            # Optional timeout for callbacks
-            try:
+            drained = 0
+            while True:
+                await self._process_raw_message(raw_msg)
+                drained += 1
+                if drained % self._mq_drain_yield_every == 0:
+                    # Don't starve other tasks during very long bursts
+                    await asyncio.sleep(0)
+                try:
+                    raw_msg = self.mq.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+
+    def parse_message(self, raw_msg: dict) -> messages.Message:
+        """
+        Parse a raw message dict into its Pydantic model. Known msg_types are validated directly
+        against their concrete model, anything else goes through the discriminated union
+        (and will raise a ValidationError if it's unrecognized).
+        """
+        model = self._message_models.get(raw_msg.get("msg_type"))
+        if model is not None:
+            return model.model_validate(raw_msg)
+        return self._message_adapter.validate_python(raw_msg)
+
+    async def _process_raw_message(self, raw_msg: dict):
+        """Parse a single message from the internal queue and delegate it to its Action"""
+        # kernel status "starting" is one example of messages with no parent header
+        if not raw_msg.get("parent_header"):
+            await self.handle_missing_parent_msg_id(raw_msg)
+            return
+
+        # Getting an "untracked action" probably means another client is talking to the Kernel
+        # over ZMQ and sending in requests. Check before parsing, it's the expensive part.
+        action = self.actions.get(raw_msg["parent_header"].get("msg_id"))
+        if action is None:
+            await self.handle_untracked_action_raw(raw_msg)
+            return
+
+        # Getting a ValidationError here probably means we need to add new Message models
+        try:
+            msg = self.parse_message(raw_msg)
+        except pydantic.ValidationError as e:
+            await self.handle_unparseable_message(raw_msg, e)
+            return
+
+        # Happy path: we have an Action for the parent request of messages we see coming in
+
+        # Log warning if we think we're seeing responses for a new Action and haven't completed
+        # the previously running action, e.g. we start getting status / content responses for
+        # a new execute_request when we haven't seen execute_reply / status idle for a previous
+        # execute request
+        running_action = self.running_action
+        if running_action and running_action is not action:
+            logger.warning(f"Observed message for {action} while {running_action} has not finished")
+
+        # Optional timeout for callbacks. Skip wait_for when there's no timeout, it'd wrap every
+        # message in its own Task for nothing
+        try:
+            if self._handler_timeout is None:
+                await action.handle_message(msg)
+            else:
                 await asyncio.wait_for(action.handle_message(msg), timeout=self._handler_timeout)
-            except asyncio.CancelledError:
-                logger.warning(f"Timeout handling callbacks for {action}")
-                continue
-            except:  # noqa: E722
-                # Important decision to not raise the exception here so that one failed callback
-                # does not stop the entire process inbound message coroutine loop
-                logger.exception("Error while handling message")
+        except asyncio.TimeoutError:
+            logger.warning(f"Timeout handling callbacks for {action}")
+        except asyncio.CancelledError:
+            # Client is shutting down, don't swallow the cancellation in the catch-all below
+            raise
+        except:  # noqa: E722
+            # Important decision to not raise the exception here so that one failed callback
+            # does not stop the entire process inbound message coroutine loop
+            logger.exception("Error while handling message")
+
+        if action.done.is_set() and not action.running:
+            self._pending_actions.pop(action.msg_id, None)
 
     async def handle_missing_parent_msg_id(self, raw_msg: dict):
         """
@@ -468,6 +716,21 @@ class KernelSidecarClient:
         """
         pass
 
+    async def handle_untracked_action_raw(self, raw_msg: dict):
+        """
+        Messages whose parent_header.msg_id isn't a tracked Action are not parsed by default. If
+        a subclass overrides handle_untracked_action, parse the message and pass it along there.
+        """
+        handler = getattr(self.handle_untracked_action, "__func__", None)
+        if handler is KernelSidecarClient.handle_untracked_action:
+            return
+        try:
+            msg = self.parse_message(raw_msg)
+        except pydantic.ValidationError as e:
+            await self.handle_unparseable_message(raw_msg, e)
+            return
+        await self.handle_untracked_action(msg)
+
     async def handle_untracked_action(self, msg: messages.Message):
         """
         In theory if we're the only client talking to a kernel, we shouldn't get into this method.
@@ -482,9 +745,12 @@ class KernelSidecarClient:
         # Make a noisy warning here because it will potentially break awaiting actions, such as
         # if kernel_info_reply ends up unparseable because LanguageInfo payload is slightly off or
         # something, then await sidecar.kernel_info_request() will never resolve
-        logger.warning(
-            "Unparseable message", extra={"body": pprint.pformat(raw_msg), "error": error}
-        )
+        # The body is formatted to a plain string so log handlers can serialize the extras, but
+        # only when the warning will actually be emitted
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning(
+                "Unparseable message", extra={"body": pprint.pformat(raw_msg), "error": error}
+            )
 
     async def handle_zmq_disconnect(self, channel_name: str):
         pass
@@ -506,8 +772,9 @@ class KernelSidecarClient:
         # it briefly and it didn't yield out of the context manager like I expected. Also not sure I
         # want to pin to 3.11+ quite yet.
         for channel in ["iopub", "shell", "control", "stdin"]:
-            task = asyncio.create_task(self.watch_channel(channel))
-            self.channel_watcher_parent_tasks.append(task)
+            self._create_tracked_task(
+                self.watch_channel(channel), self.channel_watcher_parent_tasks
+            )
             self.zmq_channels_connected[channel] = True
         self.mq_task = asyncio.create_task(self.process_message())
         await self.setup()  # in prod, this would be things like importing libs and registering Comms
@@ -517,9 +784,9 @@ class KernelSidecarClient:
         # Exiting the async context / general cleanup consists of:
         # - cancel all tasks
         # - stop zmq channel connections
-        for task in self.channel_watcher_parent_tasks:
+        for task in list(self.channel_watcher_parent_tasks):
             task.cancel()
-        for task in self.channel_watching_tasks:
+        for task in list(self.channel_watching_tasks):
             task.cancel()
         if self.mq_task:
             self.mq_task.cancel()
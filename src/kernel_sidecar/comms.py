@@ -15,7 +15,7 @@ any request type. It can then delegate comm_msg's to appropriate CommHandler ins
 comm_id seen in the comm_msg.content.
 """
 import logging
-from typing import Dict, Type, Union
+from typing import Dict, Set, Type, Union
 
 from kernel_sidecar.handlers.base import Handler
 from kernel_sidecar.models import messages
@@ -24,6 +24,9 @@ logger = logging.getLogger(__name__)
 
 
 class CommHandler(Handler):
+    # Notebooks with widgets can open hundreds of comms, skip the per-instance __dict__
+    __slots__ = ("comm_id",)
+
     def __init__(self, comm_id: str):
         self.comm_id = comm_id
 
@@ -35,6 +38,9 @@ class CommManager(Handler):
     def __init__(self, handlers: Dict[str, Type[CommHandler]] = None):
         self.comms: Dict[str, CommHandler] = {}  # keys are comm_id, values are CommHandler instance
         self.handlers = handlers or {}  # keys are target_name, values are CommHandler class
+        # comm_id's of open Output widgets, lets OutputHandler skip every other comm_msg with a
+        # single set lookup
+        self.output_widget_ids: Set[str] = set()
 
     async def handle_comm_open(self, msg: messages.CommOpen):
         """
@@ -45,33 +51,38 @@ class CommManager(Handler):
         """
         comm_id = msg.content.comm_id
         target_name = msg.content.target_name
-        if comm_id in self.comms:
-            # Seems like a weird situation if we see a second comm open for the same comm_id?
-            # Don't think it's technically against the spec.
-            handler = self.comms[comm_id]
-        else:
-            if target_name not in self.handlers:
+        # Seems like a weird situation if we see a second comm open for the same comm_id?
+        # Don't think it's technically against the spec, reuse the existing handler if so.
+        handler = self.comms.get(comm_id)
+        if handler is None:
+            handler_cls = self.handlers.get(target_name)
+            if handler_cls is None:
                 return await self.handle_unrecognized_comm_target(msg)
-            handler_cls = self.handlers[target_name]
             handler = handler_cls(comm_id=comm_id)
             self.comms[comm_id] = handler
             logger.debug("registered comm", extra={"comm_id": comm_id, "handler": handler})
         await handler(msg)
+        # WidgetHandler only knows its model name after handling the comm_open
+        if isinstance(handler, WidgetHandler) and handler.model_name == "OutputModel":
+            self.output_widget_ids.add(comm_id)
 
     async def handle_comm_msg(self, msg: messages.CommMsg):
         comm_id = msg.content.comm_id
-        if comm_id not in self.comms:
+        try:
+            handler = self.comms[comm_id]
+        except KeyError:
             return await self.handle_unrecognized_comm_id(msg)
-        handler = self.comms[comm_id]
         await handler(msg)
 
     async def handle_comm_close(self, msg: messages.CommClose):
         comm_id = msg.content.comm_id
-        if comm_id not in self.comms:
+        try:
+            handler = self.comms[comm_id]
+        except KeyError:
             return await self.handle_unrecognized_comm_id(msg)
-        handler = self.comms[comm_id]
         await handler(msg)
         del self.comms[comm_id]
+        self.output_widget_ids.discard(comm_id)
 
     async def handle_unrecognized_comm_target(self, msg: messages.CommOpen):
         """
@@ -99,6 +110,8 @@ class CommManager(Handler):
 
 
 class WidgetHandler(CommHandler):
+    __slots__ = ("state",)
+
     def __init__(self, comm_id: str):
         super().__init__(comm_id)
         self.state: Dict = {}
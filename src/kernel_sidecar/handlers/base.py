@@ -16,6 +16,26 @@ class Handler:
     >>> Kernel status: idle
     """
 
+    # Empty so that subclasses which declare __slots__ (e.g. CommHandler, one instance per comm)
+    # actually skip the per-instance __dict__. Subclasses that don't declare it get one as usual
+    __slots__ = ()
+
+    # Handlers are awaited serially in the order they're attached to an Action. Set this to True in
+    # subclasses that don't depend on that ordering (e.g. forwarding messages to a websocket) so the
+    # Action can run them concurrently alongside the other handlers
+    independent: bool = False
+
+    # False when messages without a handle_<msg_type> method would only reach the no-op
+    # unhandled_message, in which case Actions skip calling this Handler for them entirely
+    _catch_all: bool = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._catch_all = (
+            cls.unhandled_message is not Handler.unhandled_message
+            or cls.__call__ is not Handler.__call__
+        )
+
     async def __call__(self, msg: messages.Message):
         handler = getattr(self, f"handle_{msg.msg_type}", None)
         if handler:
@@ -1,4 +1,5 @@
 import collections
+from typing import Dict
 
 from kernel_sidecar.handlers.base import Handler
 from kernel_sidecar.models import messages
@@ -19,12 +20,8 @@ class DebugHandler(Handler):
 
     def __init__(self):
         self.counts = collections.defaultdict(int)
-        # don't access this in tests like "last_msg = handler.last_msg_by_type['status']" becuse
-        # it will raise an obtuse error saying a typing.Union cannot be called. What's happening
-        # is that if the key is missing, defaultdict tries to instantiate a messages.Message which
-        # is a typing.Annotated[typing.Union]] (discriminator pattern) and everything blows up.
-        # use .get_last_msg() instead.
-        self.last_msg_by_type = collections.defaultdict(messages.Message)
+        # {msg_type: last message seen of that type}, use .get_last_msg() for a readable KeyError
+        self.last_msg_by_type: Dict[str, messages.Message] = {}
 
     def get_last_msg(self, msg_type: str) -> messages.Message:
         if msg_type not in self.last_msg_by_type:
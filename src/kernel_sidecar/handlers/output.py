@@ -1,5 +1,7 @@
+import asyncio
+import collections
 import logging
-from typing import List, Union
+from typing import Deque, Dict, Optional, Union
 
 from kernel_sidecar.client import KernelSidecarClient
 from kernel_sidecar.comms import WidgetHandler
@@ -28,10 +30,14 @@ class OutputHandler(Handler):
         self.cell_id = cell_id
 
         self.clear_on_next_output = False
-        # .output_widget_contexts will be a list of Output widget Commhandler's. If user code enters
-        # into its context ("with out1: print('foo')"), we should write to its state instead of
-        # to the document model
-        self.output_widget_contexts: List[WidgetHandler] = []
+        # .output_widget_contexts will be a stack of Output widget Commhandler's, innermost first. If
+        # user code enters into its context ("with out1: print('foo')"), we should write to its
+        # state instead of to the document model
+        self.output_widget_contexts: Deque[WidgetHandler] = collections.deque()
+        # Output widgets whose state changed but hasn't been synced back to the Kernel yet, keyed
+        # by comm_id. See .sync_output_widget_state
+        self._pending_widget_syncs: Dict[str, WidgetHandler] = {}
+        self._widget_sync_handle: Optional[asyncio.Handle] = None
 
     # The following five methods should be overridden to update the document model using your own
     # Notebook builder implementation. The methods below that probably don't need to be overridden,
@@ -64,7 +70,7 @@ class OutputHandler(Handler):
         if self.output_widget_contexts:  # inside a "with out:" Output widget context
             handler: WidgetHandler = self.output_widget_contexts[0]
             handler.state["outputs"].append(content)
-            await self.sync_output_widget_state(handler)
+            self.sync_output_widget_state(handler)
             await self.add_output_widget_content(handler, content)
         else:  # not in Output widget context, just update Notebook document model
             await self.add_cell_content(content)
@@ -73,39 +79,58 @@ class OutputHandler(Handler):
         if self.output_widget_contexts:
             handler: WidgetHandler = self.output_widget_contexts[0]
             handler.state["outputs"] = []
-            await self.sync_output_widget_state(handler)
+            self.sync_output_widget_state(handler)
             await self.clear_output_widget_content(handler)
         else:
             await self.clear_cell_content()
 
-    async def sync_output_widget_state(self, handler: WidgetHandler):
-        self.client.comm_msg_request(
-            comm_id=handler.comm_id,
-            data={"method": "update", "state": {"outputs": handler.state["outputs"]}},
-        )
-
-    async def handle_stream(self, msg: messages.Stream):
+    def sync_output_widget_state(self, handler: WidgetHandler):
+        """
+        Queue an Output widget state sync back to the Kernel. Each sync sends the full outputs
+        list, so rather than sending one per output (O(n^2) over a loop printing inside "with out:")
+        the syncs are coalesced and flushed once the current burst of messages has been handled.
+        """
+        self._pending_widget_syncs[handler.comm_id] = handler
+        if self._widget_sync_handle is None:
+            loop = asyncio.get_running_loop()
+            self._widget_sync_handle = loop.call_soon(self.flush_output_widget_syncs)
+
+    def flush_output_widget_syncs(self):
+        """Send a comm_msg with the latest outputs for every Output widget that has changed"""
+        if self._widget_sync_handle:
+            self._widget_sync_handle.cancel()
+            self._widget_sync_handle = None
+        pending, self._pending_widget_syncs = self._pending_widget_syncs, {}
+        for handler in pending.values():
+            self.client.comm_msg_request(
+                comm_id=handler.comm_id,
+                data={"method": "update", "state": {"outputs": handler.state["outputs"]}},
+            )
+
+    async def action_complete(self):
+        # Make sure the Kernel-side widgets are up to date by the time the Action is done
+        self.flush_output_widget_syncs()
+
+    async def _flush_pending_clear(self):
+        """Apply a clear_output(wait=True) seen earlier, now that new output has arrived"""
         if self.clear_on_next_output:
             await self.clear_content()
             self.clear_on_next_output = False
+
+    async def handle_stream(self, msg: messages.Stream):
+        await self._flush_pending_clear()
         await self.add_content(msg.content)
 
     async def handle_execute_result(self, msg: messages.ExecuteResult):
-        if self.clear_on_next_output:
-            await self.clear_content()
-            self.clear_on_next_output = False
+        await self._flush_pending_clear()
         await self.add_content(msg.content)
 
     async def handle_error(self, msg: messages.Error):
-        if self.clear_on_next_output:
-            await self.clear_content()
-            self.clear_on_next_output = False
+        await self._flush_pending_clear()
         await self.add_content(msg.content)
 
     async def handle_display_data(self, msg: messages.DisplayData):
-        if self.clear_on_next_output:
-            await self.clear_content()
-            self.clear_on_next_output = False
+        await self._flush_pending_clear()
         await self.add_content(msg.content)
         if msg.content.display_id:
             await self.sync_display_data(msg.content)
@@ -120,24 +145,27 @@ class OutputHandler(Handler):
             await self.clear_content()
 
     async def handle_comm_msg(self, msg: messages.CommMsg):
-        # Exit early if:
-        #  - we don't recognize this comm id
-        #  - It's not a comm for an Output Widget
-        if msg.content.comm_id not in self.client.comm_manager.comms:
+        # Exit early unless this comm is an Output Widget the CommManager knows about
+        comm_id = msg.content.comm_id
+        if comm_id not in self.client.comm_manager.output_widget_ids:
+            return
+        data = msg.content.data
+        if data.get("method") != "update":
             return
-        comm_handler = self.client.comm_manager.comms[msg.content.comm_id]
-        if (
-            not isinstance(comm_handler, WidgetHandler)
-            or not comm_handler.model_name == "OutputModel"
-        ):
+        state = data.get("state", {})
+        if "msg_id" not in state:
+            # Some other state update (e.g. outputs set from the Kernel side), not a context change
             return
-        if msg.content.data["method"] == "update":
-            if msg.content.data["state"]["msg_id"]:
-                # this means we are entering into the "with Output()" context manager
-                # all further output messages (stream, display_data, error) should be added
-                # to this Output widget .outputs instead of to the cell output
-                logger.debug("entering output widget context manager")
-                self.output_widget_contexts.insert(0, comm_handler)
-            else:
-                logger.debug("exiting output widget context manager")
-                self.output_widget_contexts.remove(comm_handler)
+        # output_widget_ids can be stale if .comms was cleared or replaced directly
+        comm_handler: Optional[WidgetHandler] = self.client.comm_manager.comms.get(comm_id)
+        if comm_handler is None:
+            return
+        if state["msg_id"]:
+            # this means we are entering into the "with Output()" context manager
+            # all further output messages (stream, display_data, error) should be added
+            # to this Output widget .outputs instead of to the cell output
+            logger.debug("entering output widget context manager")
+            self.output_widget_contexts.appendleft(comm_handler)
+        else:
+            logger.debug("exiting output widget context manager")
+            self.output_widget_contexts.remove(comm_handler)
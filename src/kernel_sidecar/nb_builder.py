@@ -40,6 +40,13 @@ class NotebookBuilder:
         if not cell:
             logger.warning(f"Cell not found: {cell_id}")
             return
+        # Kernels emit stream output in small chunks. Merge consecutive stream outputs with the same
+        # name into one output the way nbformat does, instead of growing an output per chunk
+        if cell.outputs and isinstance(content, messages.StreamContent):
+            last = cell.outputs[-1]
+            if isinstance(last, messages.StreamContent) and last.name == content.name:
+                cell.outputs[-1] = last.model_copy(update={"text": last.text + content.text})
+                return
         cell.outputs.append(content)
 
     def set_execution_count(self, cell_id: str, execution_count: int):
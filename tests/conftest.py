@@ -73,6 +73,7 @@ async def kernel(ipykernel: dict) -> KernelSidecarClient:
 async def reset_kernel_state(kernel: KernelSidecarClient):
     kernel.actions.clear()
     kernel.comm_manager.comms.clear()
+    kernel.comm_manager.output_widget_ids.clear()
     # Reset the Kernel namespace before passing the client to a test
     # The log level dance here is to reduce noise if DEBUG logs are on for the "shell reset"
     log_level = logging.getLogger("kernel_sidecar").getEffectiveLevel()
@@ -1,6 +1,10 @@
 import asyncio
+import datetime
+import json
+import logging
 import textwrap
-from unittest.mock import AsyncMock
+import uuid
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
@@ -55,6 +59,75 @@ async def test_kernel_info(kernel: KernelSidecarClient):
     assert kernel_info_reply.content.status == "ok"
 
 
+async def test_get_kernel_info(kernel: KernelSidecarClient):
+    """
+    Show that kernel.get_kernel_info() caches the kernel_info_reply on the client, and only sends a
+    new kernel_info_request if refresh=True.
+    """
+    kernel_info = await kernel.get_kernel_info(refresh=True)
+    assert isinstance(kernel_info, messages.KernelInfoReply)
+    num_actions = len(kernel.actions)
+    assert await kernel.get_kernel_info() is kernel_info
+    assert len(kernel.actions) == num_actions
+
+    refreshed = await kernel.get_kernel_info(refresh=True)
+    assert refreshed is not kernel_info
+    assert len(kernel.actions) == num_actions + 1
+
+    # Concurrent callers share one kernel_info_request instead of each sending their own
+    first, second = await asyncio.gather(
+        kernel.get_kernel_info(refresh=True), kernel.get_kernel_info(refresh=True)
+    )
+    assert first is second is not refreshed
+    assert len(kernel.actions) == num_actions + 2
+
+
+async def test_running_action(kernel: KernelSidecarClient):
+    """
+    Show that kernel.running_action tracks the Action the Kernel is busy with, and that finished
+    Actions are dropped from the pending index it's served from.
+    """
+    seen = []
+
+    class RunningActionHandler(Handler):
+        async def handle_status(self, msg: messages.Status):
+            seen.append(kernel.running_action)
+
+    action = kernel.execute_request("1 + 1", handlers=[RunningActionHandler()])
+    await action
+    assert action in seen
+    assert kernel.running_action is None
+    assert action.msg_id in kernel.actions
+    assert action.msg_id not in kernel._pending_actions
+
+
+async def test_unparseable_message(kernel: KernelSidecarClient):
+    """
+    Show that an unparseable message sitting on the internal queue is skipped (not confused with
+    the previously processed message), and messages queued up behind it are still delegated.
+    """
+    handler1 = DebugHandler()
+    await kernel.kernel_info_request(handlers=[handler1])
+    kernel.mq.put_nowait({"msg_type": "not_a_real_msg_type", "parent_header": {"msg_id": "foo"}})
+    handler2 = DebugHandler()
+    await kernel.kernel_info_request(handlers=[handler2])
+    assert handler1.counts == {"status": 2, "kernel_info_reply": 1}
+    assert handler2.counts == {"status": 2, "kernel_info_reply": 1}
+
+
+async def test_unparseable_message_log(kernel: KernelSidecarClient, caplog):
+    """
+    Show that the unparseable message warning puts the body in log extras as a plain string, so log
+    handlers that serialize extras (e.g. JSON formatters) can handle it.
+    """
+    raw_msg = {"msg_type": "not_a_real_msg_type", "parent_header": {"msg_id": "foo"}}
+    with caplog.at_level(logging.WARNING, logger="kernel_sidecar.client"):
+        await kernel.handle_unparseable_message(raw_msg, error=None)
+    record = caplog.records[-1]
+    assert record.getMessage() == "Unparseable message"
+    assert "not_a_real_msg_type" in json.loads(json.dumps({"body": record.body}))["body"]
+
+
 async def test_execute_statement(kernel: KernelSidecarClient):
     """
     Code that returns a statement as the last line should have that output show up in the content
@@ -311,3 +384,246 @@ async def test_action_complete(kernel: KernelSidecarClient):
     action = kernel.execute_request("1 + 1", handlers=[handler])
     await action
     assert handler.complete
+
+
+async def test_handler_skipped_without_match(kernel: KernelSidecarClient):
+    """
+    Handlers are only called for msg_types they define a handle_<msg_type> method for, unless they
+    override unhandled_message (or __call__) to see everything
+    """
+
+    class StatusHandler(Handler):
+        def __init__(self):
+            self.seen = []
+
+        async def handle_status(self, msg: messages.Status):
+            self.seen.append(msg.msg_type)
+
+    class CatchAllHandler(StatusHandler):
+        async def unhandled_message(self, msg: messages.Message):
+            self.seen.append(msg.msg_type)
+
+    assert not StatusHandler._catch_all
+    assert CatchAllHandler._catch_all
+    assert DebugHandler._catch_all
+
+    status_handler = StatusHandler()
+    catch_all_handler = CatchAllHandler()
+    # Skipping uses the same lookup as Handler.__call__, so methods set on an instance still count
+    late_handler = StatusHandler()
+    late_handler.handle_kernel_info_reply = AsyncMock()
+    await kernel.kernel_info_request(handlers=[status_handler, catch_all_handler, late_handler])
+    assert status_handler.seen == ["status", "status"]
+    assert sorted(catch_all_handler.seen) == ["kernel_info_reply", "status", "status"]
+    assert late_handler.seen == ["status", "status"]
+    late_handler.handle_kernel_info_reply.assert_awaited_once()
+
+
+def make_status_msg(action: actions.KernelAction, execution_state: str) -> messages.Status:
+    header = {
+        "date": datetime.datetime.now(tz=datetime.timezone.utc),
+        "msg_id": str(uuid.uuid4()),
+        "msg_type": "status",
+        "session": "test-session",
+        "username": "test",
+        "version": "5.3",
+    }
+    return messages.Status(
+        header=header,
+        msg_id=header["msg_id"],
+        msg_type="status",
+        parent_header=action.request.header.model_dump(),
+        content={"execution_state": execution_state},
+    )
+
+
+async def test_kernel_idle_safety_net():
+    """
+    If the Kernel goes idle but we never see the expected reply message, the Action should have a
+    safety net scheduled that will resolve it as done anyway.
+    """
+    action = actions.KernelAction(requests.ExecuteRequest())
+    await action.handle_message(make_status_msg(action, "busy"))
+    await action.handle_message(make_status_msg(action, "idle"))
+    assert not action.done.is_set()
+    assert action.safety_net_handle is not None
+
+    # Fire the safety net now instead of waiting on the loop.call_later timer
+    action.safety_net_handle.cancel()
+    action.kernel_idle_safety_net()
+    await asyncio.wait_for(action, timeout=1)
+    assert action.reply_seen.is_set()
+    assert not action.running
+
+
+async def test_handler_methods_added_later():
+    """
+    handle_<msg_type> methods set on a Handler instance, or added to the class after it's defined,
+    are delegated to just like methods defined in the class body
+    """
+
+    class LateHandler(Handler):
+        pass
+
+    action = actions.KernelAction(requests.KernelInfoRequest())
+    msg = make_status_msg(action, "busy")
+
+    instance_handler = LateHandler()
+    instance_handler.handle_status = AsyncMock()
+    await instance_handler(msg)
+    instance_handler.handle_status.assert_awaited_once_with(msg)
+
+    class_method = AsyncMock()
+
+    async def handle_status(self, msg: messages.Status):
+        await class_method(msg)
+
+    LateHandler.handle_status = handle_status
+    await LateHandler()(msg)
+    class_method.assert_awaited_once_with(msg)
+
+
+async def test_independent_handlers():
+    """
+    Handlers flagged as independent run concurrently with the other handlers attached to an Action
+    instead of waiting for the handlers attached before them.
+    """
+    status_seen = asyncio.Event()
+
+    class WaitingHandler(Handler):
+        independent = True
+
+        async def handle_status(self, msg: messages.Status):
+            # Would time out if this was awaited before StatusHandler, which is attached after it
+            await asyncio.wait_for(status_seen.wait(), timeout=1)
+
+    class StatusHandler(Handler):
+        async def handle_status(self, msg: messages.Status):
+            status_seen.set()
+
+    action = actions.KernelAction(
+        requests.ExecuteRequest(), handlers=[WaitingHandler(), StatusHandler()]
+    )
+    await asyncio.wait_for(action.handle_message(make_status_msg(action, "busy")), timeout=2)
+    assert status_seen.is_set()
+
+
+async def test_untracked_action(kernel: KernelSidecarClient, monkeypatch):
+    """
+    Messages for requests the client didn't send are only parsed if handle_untracked_action is
+    overridden.
+    """
+    other_action = actions.KernelAction(requests.KernelInfoRequest())
+    raw_msg = make_status_msg(other_action, "busy").model_dump()
+    monkeypatch.setattr(kernel, "parse_message", Mock(wraps=kernel.parse_message))
+    await kernel._process_raw_message(raw_msg)
+    kernel.parse_message.assert_not_called()
+
+    monkeypatch.setattr(kernel, "handle_untracked_action", AsyncMock())
+    await kernel._process_raw_message(raw_msg)
+    kernel.handle_untracked_action.assert_called_once()
+    assert isinstance(kernel.handle_untracked_action.call_args.args[0], messages.Status)
+
+
+async def test_handler_timeout(kernel: KernelSidecarClient, monkeypatch):
+    """
+    With a handler timeout set, a slow handler is cut off and the client moves on to process the
+    rest of the Action's messages.
+    """
+
+    class SlowHandler(Handler):
+        finished = False
+
+        async def handle_execute_input(self, msg: messages.ExecuteInput):
+            await asyncio.sleep(5)
+            self.finished = True
+
+    monkeypatch.setattr(kernel, "_handler_timeout", 0.1)
+    handler = SlowHandler()
+    debug_handler = DebugHandler()
+    action = kernel.execute_request("1 + 1", handlers=[handler, debug_handler])
+    await asyncio.wait_for(action, timeout=3)
+    assert not handler.finished
+    assert debug_handler.counts["execute_reply"] == 1
+
+
+async def test_max_tracked_actions(kernel: KernelSidecarClient, monkeypatch):
+    """
+    Finished Actions are evicted from kernel.actions oldest-first once there are more than
+    _max_tracked_actions, unfinished ones are kept.
+    """
+    monkeypatch.setattr(kernel, "_max_tracked_actions", 2)
+    first = kernel.kernel_info_request()
+    await first
+    second = kernel.kernel_info_request()
+    await second
+    third = kernel.kernel_info_request()
+    await third
+    assert list(kernel.actions) == [second.msg_id, third.msg_id]
+    fourth = kernel.kernel_info_request()
+    assert first.msg_id not in kernel.actions
+    assert fourth.msg_id in kernel.actions
+    await fourth
+
+    # 0 evicts every finished Action on the next send, but never ones that are still running
+    monkeypatch.setattr(kernel, "_max_tracked_actions", 0)
+    slow = kernel.execute_request("import time; time.sleep(0.5)")
+    quick = kernel.kernel_info_request()
+    assert list(kernel.actions) == [slow.msg_id, quick.msg_id]
+    await asyncio.sleep(0.2)
+    assert slow.running
+    another = kernel.kernel_info_request()
+    assert slow.msg_id in kernel.actions
+    assert quick.msg_id in kernel.actions
+    await asyncio.gather(slow, quick, another)
+    last = kernel.kernel_info_request()
+    assert list(kernel.actions) == [last.msg_id]
+    await last
+
+
+async def test_zmq_drain(kernel: KernelSidecarClient, monkeypatch):
+    """
+    When messages pile up on a ZMQ socket, the channel watcher reads the extra ones synchronously
+    after each await, at most _zmq_drain_max at a time, without dropping or reordering any.
+    """
+    monkeypatch.setattr(kernel, "_zmq_drain_max", 3)
+    # Number of iopub messages drained synchronously after each awaited get_msg()
+    drained = []
+    release = asyncio.Event()
+    channel = kernel._get_channel("iopub")
+    get_msg = channel.get_msg
+
+    async def gated_get_msg():
+        # Park the watcher here so the Kernel's messages queue up on the socket
+        await release.wait()
+        msg = await get_msg()
+        drained.append(-1)  # the awaited message itself is enqueued too
+        return msg
+
+    enqueue = kernel._enqueue_message
+
+    def recording_enqueue(raw_msg: dict, channel_name: str):
+        if channel_name == "iopub" and drained:
+            drained[-1] += 1
+        enqueue(raw_msg, channel_name)
+
+    monkeypatch.setattr(channel, "get_msg", gated_get_msg)
+    monkeypatch.setattr(kernel, "_enqueue_message", recording_enqueue)
+
+    class DisplayHandler(Handler):
+        def __init__(self):
+            self.seen = []
+
+        async def handle_display_data(self, msg: messages.DisplayData):
+            self.seen.append(msg.content.data["text/plain"])
+
+    handler = DisplayHandler()
+    action = kernel.execute_request("for i in range(20): display(i)", handlers=[handler])
+    # execute_reply comes in on the shell channel once the code has run and its displays are sent
+    await asyncio.wait_for(action.reply_seen.wait(), timeout=10)
+    release.set()
+    await action
+
+    assert handler.seen == [str(i) for i in range(20)]
+    assert max(drained) == 3
+    assert all(0 <= n <= 3 for n in drained)
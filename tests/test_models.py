@@ -1,8 +1,11 @@
 import datetime
+import typing
 
 import pydantic
 from dateutil.tz import tzlocal
 
+from kernel_sidecar.client import _concrete_message_models
+from kernel_sidecar.models import messages
 from kernel_sidecar.models.messages import Message
 
 
@@ -51,3 +54,14 @@ async def test_kernel_info_missing_codemirror_mode():
     }
     message = pydantic.TypeAdapter(Message).validate_python(msg)
     assert message.content.language_info.codemirror_mode == "typescript"
+
+
+def test_concrete_message_models():
+    """
+    The client skips the discriminated union when it knows the concrete model for a msg_type, make
+    sure every model in the union is picked up.
+    """
+    models = _concrete_message_models(Message)
+    assert models["status"] is messages.Status
+    assert models["kernel_info_reply"] is messages.KernelInfoReply
+    assert set(models.values()) == set(typing.get_args(typing.get_args(Message)[0]))
@@ -1,9 +1,12 @@
 import asyncio
 import textwrap
+from unittest.mock import Mock
 
 import pytest
 
 from kernel_sidecar.client import KernelSidecarClient
+from kernel_sidecar.comms import WidgetHandler
+from kernel_sidecar.models import messages
 from kernel_sidecar.models.notebook import Notebook
 from kernel_sidecar.nb_builder import NotebookBuilder, SimpleOutputHandler
 
@@ -29,6 +32,28 @@ async def test_stream(kernel: KernelSidecarClient, builder: NotebookBuilder):
     assert builder.nb.cells[0].execution_count == 1
 
 
+async def test_stream_coalesced(kernel: KernelSidecarClient, builder: NotebookBuilder):
+    """
+    Consecutive stream messages with the same name should be merged into a single output
+    """
+    code = textwrap.dedent(
+        """
+    import sys, time
+    print('foo', flush=True)
+    time.sleep(0.3)
+    print('bar', flush=True)
+    print('baz', file=sys.stderr, flush=True)
+    """
+    )
+    cell = builder.add_cell(source=code)
+    handler = SimpleOutputHandler(kernel, cell.id, builder)
+    await kernel.execute_request(cell.source, handlers=[handler])
+    assert [output.model_dump() for output in builder.nb.cells[0].outputs] == [
+        {"output_type": "stream", "name": "stdout", "text": "foo\nbar\n"},
+        {"output_type": "stream", "name": "stderr", "text": "baz\n"},
+    ]
+
+
 async def test_display_data(kernel: KernelSidecarClient, builder: NotebookBuilder):
     """
     Show that display_data syncs are called when:
@@ -112,6 +137,10 @@ async def test_output_widget(kernel: KernelSidecarClient, builder: NotebookBuild
     await kernel.execute_request(
         cell1.source, handlers=[SimpleOutputHandler(kernel, cell1.id, builder)]
     )
+    # CommManager tracks the Output widget comm so OutputHandler can pick out its comm_msg's
+    output_widget_ids = kernel.comm_manager.output_widget_ids
+    assert output_widget_ids
+    assert all(kernel.comm_manager.comms[i].model_name == "OutputModel" for i in output_widget_ids)
     await kernel.execute_request(
         cell2.source, handlers=[SimpleOutputHandler(kernel, cell2.id, builder)]
     )
@@ -158,3 +187,45 @@ async def test_output_widget(kernel: KernelSidecarClient, builder: NotebookBuild
     )
     assert builder.nb.cells[3].outputs[0].output_type == "execute_result"
     assert "ZeroDivisionError" in builder.nb.cells[3].outputs[0].data["text/plain"]
+
+
+async def test_output_widget_syncs_coalesced(
+    kernel: KernelSidecarClient, builder: NotebookBuilder, monkeypatch
+):
+    """
+    Several outputs written to an Output widget in a row should be synced back to the Kernel with
+    a single comm_msg carrying the final state, not one comm_msg per output
+    """
+    monkeypatch.setattr(kernel, "comm_msg_request", Mock())
+    cell = builder.add_cell(source="")
+    handler = SimpleOutputHandler(kernel, cell.id, builder)
+    widget = WidgetHandler(comm_id="abc")
+    widget.state = {"_model_name": "OutputModel", "outputs": []}
+    handler.output_widget_contexts.appendleft(widget)
+
+    for text in ["foo\n", "bar\n", "baz\n"]:
+        await handler.add_content(messages.StreamContent(name="stdout", text=text))
+    assert kernel.comm_msg_request.call_count == 0
+
+    await asyncio.sleep(0)
+    assert kernel.comm_msg_request.call_count == 1
+    data = kernel.comm_msg_request.call_args.kwargs["data"]
+    assert [output.text for output in data["state"]["outputs"]] == ["foo\n", "bar\n", "baz\n"]
+
+    # Nothing pending, completing the Action doesn't send another sync
+    await handler.action_complete()
+    assert kernel.comm_msg_request.call_count == 1
+
+
+async def test_output_widget_id_without_comm(kernel: KernelSidecarClient, builder: NotebookBuilder):
+    """
+    A comm_id left in CommManager.output_widget_ids after .comms was cleared directly is ignored
+    rather than raising a KeyError
+    """
+    kernel.comm_manager.output_widget_ids.add("stale")
+    handler = SimpleOutputHandler(kernel, builder.add_cell(source="").id, builder)
+    msg = Mock()
+    msg.content.comm_id = "stale"
+    msg.content.data = {"method": "update", "state": {"msg_id": "abc"}}
+    await handler.handle_comm_msg(msg)
+    assert not handler.output_widget_contexts
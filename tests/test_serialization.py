@@ -0,0 +1,97 @@
+import datetime
+import math
+
+import pytest
+from jupyter_client import session as jupyter_session
+
+from kernel_sidecar import client
+from kernel_sidecar.client import _orjson_pack, _orjson_unpack, _use_orjson
+
+pytest.importorskip("orjson")
+
+
+def test_orjson_pack_round_trip():
+    msg = {
+        "header": {"msg_id": "abc", "date": datetime.datetime(2024, 1, 1, 12, 30)},
+        "content": {"code": "print('\u00e9')", "silent": False, "outputs": [1, 2.5, None]},
+    }
+    packed = _orjson_pack(msg)
+    assert _orjson_unpack(packed) == jupyter_session.json_unpacker(jupyter_session.json_packer(msg))
+    assert _orjson_unpack(packed)["header"]["date"] == "2024-01-01T12:30:00Z"
+
+
+def test_orjson_pack_fallback():
+    """
+    Payloads orjson refuses to serialize fall back to jupyter_client's stdlib json packer
+    """
+    # non-str dict keys
+    msg = {"content": {1: "a", "b": 2}}
+    assert _orjson_pack(msg) == jupyter_session.json_packer(msg)
+    assert _orjson_unpack(_orjson_pack(msg)) == {"content": {"1": "a", "b": 2}}
+    # integers wider than 64 bits
+    msg = {"content": {"big": 2**70}}
+    assert _orjson_pack(msg) == jupyter_session.json_packer(msg)
+    assert _orjson_unpack(_orjson_pack(msg)) == msg
+
+
+def test_orjson_pack_nan():
+    """
+    orjson doesn't reject NaN, it writes null like jupyter_client's own orjson packer does (8+),
+    so the message stays valid JSON on both ends
+    """
+    packed = _orjson_pack({"content": {"value": float("nan")}})
+    assert _orjson_unpack(packed) == {"content": {"value": None}}
+    if hasattr(jupyter_session, "orjson_packer"):
+        assert packed == jupyter_session.orjson_packer({"content": {"value": float("nan")}})
+
+
+def test_orjson_unpack():
+    assert _orjson_unpack(b'{"a": [1, "b", null], "c": {"d": true}}') == {
+        "a": [1, "b", None],
+        "c": {"d": True},
+    }
+
+
+def test_orjson_unpack_fallback():
+    """
+    orjson rejects some payloads that the stdlib json unpacker used by jupyter_client tolerates,
+    those should fall back to it instead of raising
+    """
+    # NaN isn't valid JSON but stdlib json reads it
+    assert math.isnan(_orjson_unpack(b'{"a": NaN}')["a"])
+    # invalid utf-8 is replaced rather than raising
+    assert _orjson_unpack(b'{"a": "\xff"}') == jupyter_session.json_unpacker(b'{"a": "\xff"}')
+
+
+def test_use_orjson(monkeypatch):
+    """
+    On jupyter_client versions without their own orjson support, Sessions are switched over to the
+    orjson packer / unpacker, and messages still round-trip through serialize / deserialize
+    """
+    monkeypatch.delattr(jupyter_session, "orjson_unpacker", raising=False)
+    session = jupyter_session.Session()
+    _use_orjson(session)
+    assert session.pack is client._orjson_pack
+    assert session.unpack is client._orjson_unpack
+
+    msg = session.msg("execute_request", content={"code": "1 + 1", "silent": False})
+    _, parts = session.feed_identities(session.serialize(msg))
+    received = session.deserialize(parts)
+    assert received["content"] == {"code": "1 + 1", "silent": False}
+    assert received["header"]["msg_id"] == msg["header"]["msg_id"]
+
+
+def test_use_orjson_skipped(monkeypatch):
+    """
+    Sessions are left alone when jupyter_client already uses orjson or orjson isn't installed
+    """
+    session = jupyter_session.Session()
+    pack, unpack = session.pack, session.unpack
+    monkeypatch.setattr(jupyter_session, "orjson_unpacker", lambda s: s, raising=False)
+    _use_orjson(session)
+    assert (session.pack, session.unpack) == (pack, unpack)
+
+    monkeypatch.delattr(jupyter_session, "orjson_unpacker")
+    monkeypatch.setattr(client, "orjson", None)
+    _use_orjson(session)
+    assert (session.pack, session.unpack) == (pack, unpack)
@@ -47,3 +47,25 @@ async def test_zmq_disconnect(ipykernel: dict):
         # in local dev / prod, it's nearly instant.
         await asyncio.wait_for(action, timeout=30)
         assert kernel.channel_disconnects == {"iopub": 1}
+
+
+async def test_stop_channels(ipykernel: dict):
+    """
+    Show that channels stopped on purpose are left closed instead of being cycled like a dropped
+    ZMQ connection, and the disconnect hook isn't called for them.
+    """
+    kernel: DisconnectHandlingClient
+    async with DisconnectHandlingClient(connection_info=ipykernel) as kernel:
+        await kernel.kernel_info_request()
+        iopub = kernel._get_channel("iopub")
+        kernel.kc.stop_channels()
+        # Watchers end on their own once they see the closed channels
+        for _ in range(100):
+            if not kernel.channel_watcher_parent_tasks:
+                break
+            await asyncio.sleep(0.01)
+        assert not kernel.channel_watcher_parent_tasks
+        assert not kernel.channel_watching_tasks
+        assert kernel.kc._iopub_channel is iopub
+        assert not iopub.is_alive()
+        assert kernel.channel_disconnects == {}